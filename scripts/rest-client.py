@@ -2,35 +2,18 @@
 """example python3
 """
 import sys
+import csv
 import json
-# import os
-# import time
-import requests
-# import time
-from datetime import date
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 from datetime import datetime
-#from dataclasses import dataclass
-
-def computeDateDoy(year, month, mday):
-    n1 = int((275 * month) / 9)
-    n2 = int((month + 9) / 12)
-    n3 = (1 + int((year - 4 * int(year / 4) + 2) / 3))
-    n = n1 - (n2 * n3) + mday - 30
-    return n
+from datetime import timezone
 
 def datetimeToEpoch(years, months, mday, hours, mins, secs):
-    epoch_start = 1970
-    total_days = 0
-    total_secs = 0
-
-    while epoch_start < years:
-        total_days = total_days + computeDateDoy(epoch_start, 12, 31)
-        epoch_start = epoch_start + 1
-        total_days = total_days + computeDateDoy(years, months, mday - 1)
-        total_secs = (total_days * 86400) + (hours * 60 * 60) + (mins * 60) + secs
-    return total_secs
+    return int(datetime(years, months, mday, hours, mins, secs, tzinfo=timezone.utc).timestamp())
 
-#@dataclass
 class Transaction:
     def __init__(self, guid, account_type, account_name_owner, description, category, notes, transactionState, reoccurring, amount, transactionDate ):
         self.guid = guid
@@ -49,23 +32,14 @@ class Transaction:
     def __str__(self):
         return json.dumps(self.__dict__)
 
-def fileRead(ifname):
-  with open(ifname, 'r') as ifp:
-    #row = ifp.readline()
-    #elements = row.split("\t")
-    fileContent = ifp.read()
-  ifp.closed
-  return fileContent
-
-def separateByRow(fileContent):
-  rows = fileContent.splitlines()
-  return rows
+def fileRows(ifname):
+  with open(ifname, 'r', newline='') as ifp:
+    yield from csv.reader(ifp, delimiter='\t', quoting=csv.QUOTE_NONE)
 
-def processRow(row):
-  cols = row.split("\t")
+def processRow(cols):
   if len(cols) == 8:
-    print(cols[0] + cols[1] + cols[2] + cols[3] + cols[4] + cols[5] + cols[6] + cols[7])
-    transaction = Transaction('', '', 'credit', cols[1], cols[3], cols[4], cols[7], cols[6], 'false', cols[5], cols[2], '0', '0')
+    print(''.join(cols))
+    transaction = Transaction('', 'credit', cols[1], cols[3], cols[4], cols[7], cols[6], 'false', cols[5], cols[2])
     print(transaction)
   else:
     print(len(cols))
@@ -77,12 +51,15 @@ def main():
     if len(sys.argv) != 1:
       print("Usage: %s <noargs>" % sys.argv[0])
       sys.exit(1)
-    # fileContent = fileRead("input.txt")
-    # rows = separateByRow(fileContent)
-    # for idx in range(len(rows)):
-    #   processRow(rows[idx])
-    response = requests.get('https://hornsup:8080/transaction/select/04ca4498-fa41-47f2-b501-9084e021998b')
-    data = response.json()
+    # for cols in fileRows("input.txt"):
+    #   processRow(cols)
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4))
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    response = session.get('https://hornsup:8080/transaction/select/04ca4498-fa41-47f2-b501-9084e021998b', timeout=(3.05, 10))
+    data = json_loads(response.content)
     print(data)
     sys.exit(0)
 